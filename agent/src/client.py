@@ -18,20 +18,40 @@ class GhostfolioClient:
 
     Reuses a single httpx.AsyncClient for connection pooling.
     Call close() when done, or use as an async context manager.
+
+    Pass *http_client* to share one connection pool across many per-user
+    clients; its base_url must match *base_url* (ValueError otherwise), and
+    a shared client is left open by close().
     """
 
-    def __init__(self, base_url: str, auth_token: str):
+    def __init__(
+        self,
+        base_url: str,
+        auth_token: str,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
-        self._http = httpx.AsyncClient(
+        # httpx normalizes host case and default ports, and stores base_url
+        # with a trailing slash, so compare URLs rather than raw strings.
+        if http_client is not None and httpx.URL(self.base_url + "/") != http_client.base_url:
+            shared_url = str(http_client.base_url)
+            raise ValueError(
+                f"http_client base_url {shared_url!r} does not match {self.base_url!r}"
+            )
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(
             base_url=self.base_url,
-            headers={"Authorization": f"Bearer {auth_token}"},
             timeout=15,
         )
+        # Sent per request so a shared pool never carries one user's token
+        self._auth_headers = {"Authorization": f"Bearer {auth_token}"}
 
     async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
         """Make an HTTP request with unified error handling."""
         try:
-            resp = await self._http.request(method, path, **kwargs)
+            resp = await self._http.request(
+                method, path, headers=self._auth_headers, **kwargs
+            )
             resp.raise_for_status()
             return resp
         except httpx.TimeoutException:
@@ -50,7 +70,8 @@ class GhostfolioClient:
             )
 
     async def close(self):
-        await self._http.aclose()
+        if self._owns_http:
+            await self._http.aclose()
 
     async def __aenter__(self):
         return self
@@ -84,6 +105,8 @@ class GhostfolioClient:
         tags: str | None = None,
         skip: int | None = None,
         take: int | None = None,
+        sort_column: str | None = None,
+        sort_direction: str | None = None,
     ) -> dict:
         params = {}
         if accounts:
@@ -96,6 +119,10 @@ class GhostfolioClient:
             params["skip"] = skip
         if take is not None:
             params["take"] = take
+        if sort_column:
+            params["sortColumn"] = sort_column
+        if sort_direction:
+            params["sortDirection"] = sort_direction
         resp = await self._request("GET", "/api/v1/order", params=params)
         return resp.json()
 
@@ -1,12 +1,15 @@
 import asyncio
+import contextlib
 import logging
 import os
 import re
 import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Optional
 
+import httpx
 from dotenv import load_dotenv
-from fastapi import FastAPI, Header, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Request
 from langchain_core.messages import AIMessage, HumanMessage
 from pydantic import BaseModel
 
@@ -35,14 +38,27 @@ def trim_messages(messages: list, max_messages: int = MAX_HISTORY_MESSAGES) -> l
         return messages[-max_messages:]
     return messages
 
-app = FastAPI(title="AgentForge", version="0.1.0")
-
 GHOSTFOLIO_BASE_URL = os.getenv("GHOSTFOLIO_BASE_URL", "http://localhost:3333")
 REDIS_URL = os.getenv("REDIS_URL")
 
 # Create agent once at startup (stateless — per-request state via config)
 agent = create_agent()
 
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One Ghostfolio pool shared by all users, so it must never store cookies
+    ghostfolio_http = httpx.AsyncClient(
+        base_url=GHOSTFOLIO_BASE_URL,
+        timeout=15,
+        cookies=CookieJar(DefaultCookiePolicy(allowed_domains=[])),
+    )
+    app.state.ghostfolio_http = ghostfolio_http
+    yield
+    await ghostfolio_http.aclose()
+
+
+app = FastAPI(title="AgentForge", version="0.1.0", lifespan=lifespan)
+
 # Initialize persistent memory store
 _redis_client = None
 if REDIS_URL:
@@ -132,8 +148,8 @@ _PRONOUN_PATTERN = re.compile(
     r"\b(?:her|hers|his|their|them|theirs|she|he)\b", re.IGNORECASE
 )
 
-# Pre-compile politician name patterns for efficient scanning.
-_POLITICIAN_NAMES = [p["name"] for p in POLITICIANS]
+# Pre-compute (display name, lowercase name) pairs for efficient scanning.
+_POLITICIAN_NAMES = [(p["name"], p["name"].lower()) for p in POLITICIANS]
 
 
 def _resolve_context(
@@ -160,9 +176,9 @@ def _resolve_context(
         ai_messages_checked += 1
         if ai_messages_checked > 4:
             break
-        content = msg.content if isinstance(msg.content, str) else ""
-        for name in _POLITICIAN_NAMES:
-            if name.lower() in content.lower():
+        content = msg.content.lower() if isinstance(msg.content, str) else ""
+        for name, name_lower in _POLITICIAN_NAMES:
+            if name_lower in content:
                 return (
                     f"{user_message}\n\n"
                     f'[Context: the pronoun refers to {name} from the previous discussion]'
@@ -172,7 +188,7 @@ def _resolve_context(
 
 
 @app.post("/chat", response_model=ChatResponse)
-async def chat(body: ChatRequest, authorization: str = Header()):
+async def chat(body: ChatRequest, request: Request, authorization: str = Header()):
     token = _extract_token(authorization)
 
     # Use session_id for chat history isolation when provided (e.g. evals),
@@ -189,7 +205,11 @@ async def chat(body: ChatRequest, authorization: str = Header()):
             elif msg.role in ("agent", "assistant"):
                 messages.append(AIMessage(content=msg.content))
     else:
-        stored_history = await chat_history_store.get_history(history_key)
+        # Only the tail survives trim_messages below, so don't load and decode
+        # older messages (leaving room for the new user message).
+        stored_history = await chat_history_store.get_history(
+            history_key, limit=MAX_HISTORY_MESSAGES - 1
+        )
         for msg in stored_history:
             if msg["role"] == "user":
                 messages.append(HumanMessage(content=msg["content"]))
@@ -236,7 +256,11 @@ async def chat(body: ChatRequest, authorization: str = Header()):
     run_config.setdefault("callbacks", []).append(timing_cb)
 
     try:
-        async with GhostfolioClient(base_url=GHOSTFOLIO_BASE_URL, auth_token=token) as client:
+        async with GhostfolioClient(
+            base_url=GHOSTFOLIO_BASE_URL,
+            auth_token=token,
+            http_client=request.app.state.ghostfolio_http,
+        ) as client:
             run_config["configurable"]["client"] = client
             result = await asyncio.wait_for(
                 agent.ainvoke(
@@ -299,8 +323,12 @@ async def chat(body: ChatRequest, authorization: str = Header()):
 
     for msg in reversed(result_messages):
         if hasattr(msg, "content") and msg.type == "ai" and msg.content:
-            # Run verification layer (safe — won't crash the response)
-            verification = verify_response(
+            # Run verification layer (safe — won't crash the response).
+            # The checks are CPU-bound regex scans over the response and all
+            # tool outputs, so run them in a worker thread to keep the event
+            # loop free for other requests.
+            verification = await asyncio.to_thread(
+                verify_response,
                 response=msg.content,
                 tools_used=metrics.get("tools_used", []),
                 tool_outputs=tool_outputs,
@@ -318,8 +346,9 @@ async def chat(body: ChatRequest, authorization: str = Header()):
                     unique_tools.append(t)
 
             # Persist both messages to chat history
-            await chat_history_store.append_message(history_key, "user", body.message)
-            await chat_history_store.append_message(history_key, "agent", response_content)
+            await chat_history_store.append_messages(
+                history_key, [("user", body.message), ("agent", response_content)]
+            )
 
             return ChatResponse(
                 content=response_content,
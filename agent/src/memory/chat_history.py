@@ -60,30 +60,43 @@ class ChatHistoryStore:
 
     async def append_message(self, auth_token: str, role: str, content: str) -> None:
         """Append a message to the user's chat history."""
+        await self.append_messages(auth_token, [(role, content)])
+
+    async def append_messages(
+        self, auth_token: str, messages: list[tuple[str, str]]
+    ) -> None:
+        """Append several (role, content) messages in one write."""
+        if not messages:
+            return
         key = _chat_key(auth_token)
-        message = json.dumps({"role": role, "content": content})
+        entries = [{"role": role, "content": content} for role, content in messages]
 
         if self._redis:
             try:
                 # Replay any buffered fallback messages first
                 await self._flush_fallback(key)
-                await self._redis.rpush(key, message)
+                await self._redis.rpush(key, *(json.dumps(m) for m in entries))
                 await self._redis.expire(key, CHAT_TTL_SECONDS)
                 return
             except Exception as e:
                 logger.warning("Redis append failed, using fallback: %s", e)
 
-        self._fallback.setdefault(key, []).append({"role": role, "content": content})
+        self._fallback.setdefault(key, []).extend(entries)
 
-    async def get_history(self, auth_token: str) -> list[dict[str, str]]:
-        """Get the full chat history for a user."""
+    async def get_history(
+        self, auth_token: str, limit: int | None = None
+    ) -> list[dict[str, str]]:
+        """Get the chat history for a user, or only its last *limit* messages."""
+        if limit == 0:
+            return []
         key = _chat_key(auth_token)
+        start = -limit if limit is not None else 0
 
         if self._redis:
             try:
                 # Replay any buffered fallback messages first
                 await self._flush_fallback(key)
-                raw_messages = await self._redis.lrange(key, 0, -1)
+                raw_messages = await self._redis.lrange(key, start, -1)
                 # Refresh TTL on read
                 if raw_messages:
                     await self._redis.expire(key, CHAT_TTL_SECONDS)
@@ -94,7 +107,7 @@ class ChatHistoryStore:
             except Exception as e:
                 logger.warning("Redis get_history failed, using fallback: %s", e)
 
-        return list(self._fallback.get(key, []))
+        return self._fallback.get(key, [])[start:]
 
     async def _flush_fallback(self, key: str) -> None:
         """Replay buffered in-memory messages to Redis and clear the buffer."""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 
 from langchain_core.runnables import RunnableConfig
@@ -36,8 +37,10 @@ async def benchmark_comparison(
     effective_range = range or "max"
 
     try:
-        benchmarks = await client.get_benchmarks()
-        performance = await client.get_portfolio_performance(range=effective_range)
+        benchmarks, performance = await asyncio.gather(
+            client.get_benchmarks(),
+            client.get_portfolio_performance(range=effective_range),
+        )
     except GhostfolioAPIError as e:
         return f"Error fetching benchmark data: {e}"
     perf_summary = performance.get("performance", {})
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from typing import Optional
 
@@ -35,8 +36,10 @@ async def portfolio_analysis(
     effective_range = range or "max"
 
     try:
-        details = await client.get_portfolio_details(range=effective_range)
-        performance = await client.get_portfolio_performance(range=effective_range)
+        details, performance = await asyncio.gather(
+            client.get_portfolio_details(range=effective_range),
+            client.get_portfolio_performance(range=effective_range),
+        )
     except GhostfolioAPIError as e:
         return f"Error fetching portfolio data: {e}"
 
@@ -5,6 +5,9 @@ from langchain_core.tools import tool
 
 from ..client import GhostfolioAPIError, GhostfolioClient
 
+# Escape pipes and flatten newlines so rule details can't break the table
+_TABLE_CELL_ESCAPE = str.maketrans({"|": "\\|", "\n": " "})
+
 
 @tool
 async def risk_assessment(
@@ -28,12 +31,12 @@ async def risk_assessment(
     except GhostfolioAPIError as e:
         return f"Error fetching risk report: {e}"
     # API returns data under xRay.categories (list of category objects)
-    categories = report.get("xRay", {}).get("categories", [])
+    categories = (report.get("xRay") or {}).get("categories", [])
 
     if not categories:
         # Fallback: try legacy flat "rules" dict format
         categories = []
-        legacy_rules = report.get("rules", {})
+        legacy_rules = report.get("rules") or {}
         if legacy_rules:
             for key, rule_list in legacy_rules.items():
                 categories.append({"key": key, "name": key.replace("_", " ").title(), "rules": rule_list})
@@ -41,59 +44,48 @@ async def risk_assessment(
     if not categories:
         return "No risk analysis data available."
 
-    # Collect all rules across categories for summary scoring
+    # Single pass: count totals, collect warnings, and build the per-category
+    # tables (skip inactive rules). The score line is emitted ahead of the
+    # tables once the counts are known.
     total_rules = 0
     passed_rules = 0
     warnings: list[dict] = []
+    sections: list[str] = []
 
-    lines = ["**Portfolio Risk Assessment (X-Ray)**\n"]
-
-    # First pass: count totals and collect warnings (skip inactive rules)
-    for category_obj in categories:
-        category_rules = category_obj.get("rules", [])
-        if not category_rules:
-            continue
-        for rule in category_rules:
-            if not rule.get("isActive", False):
-                continue
-            total_rules += 1
-            value = rule.get("value", False)
-            if value:
-                passed_rules += 1
-            else:
-                warnings.append(rule)
-
-    # Summary score
-    lines.append(
-        f"**Risk Score: {passed_rules} of {total_rules} rules passed**\n"
-    )
-
-    # Detailed breakdown per category
     for category_obj in categories:
         category_label = category_obj.get("name", category_obj.get("key", "Unknown"))
         category_rules = category_obj.get("rules", [])
-        lines.append(f"### {category_label}\n")
+        sections.append(f"### {category_label}\n")
 
         if not category_rules:
-            lines.append("No rules evaluated.\n")
+            sections.append("No rules evaluated.\n")
             continue
 
-        lines.append("| Rule | Status | Details |")
-        lines.append("|------|--------|---------|")
+        sections.append("| Rule | Status | Details |\n|------|--------|---------|")
 
         for rule in category_rules:
             if not rule.get("isActive", False):
                 continue
+            total_rules += 1
             name = rule.get("name", "Unknown")
             value = rule.get("value", False)
+            if value:
+                passed_rules += 1
+            else:
+                warnings.append(rule)
             evaluation = rule.get("evaluation", "")
             status = "PASS" if value else "WARN"
             details = evaluation if evaluation else "No details available"
-            # Escape pipe characters in details to avoid breaking the table
-            details = details.replace("|", "\\|")
-            lines.append(f"| {name} | {status} | {details} |")
+            details = details.translate(_TABLE_CELL_ESCAPE)
+            sections.append(f"| {name} | {status} | {details} |")
 
-        lines.append("")
+        sections.append("")
+
+    lines = [
+        "**Portfolio Risk Assessment (X-Ray)**\n",
+        f"**Risk Score: {passed_rules} of {total_rules} rules passed**\n",
+        *sections,
+    ]
 
     # Key Warnings section
     if warnings:
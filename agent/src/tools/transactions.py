@@ -7,6 +7,11 @@ from langchain_core.tools import tool
 
 from ..client import GhostfolioAPIError, GhostfolioClient
 
+# Row template for the activity table, bound once at import time
+_ROW_FORMAT = (
+    "| {} | {} | {} | {} | {:,.4g} | {:,.2f} | {:,.2f} | {:,.2f} | {} | {} |"
+).format
+
 
 @tool
 async def transaction_history(
@@ -37,11 +42,17 @@ async def transaction_history(
     """
     client: GhostfolioClient = config["configurable"]["client"]
 
+    # Ask the API for newest-first ordering so `take` keeps the most recent
+    # activities (Ghostfolio defaults to oldest-first). Symbol and type
+    # filters stay client-side: the API only filters by symbol together with
+    # a data source, and has no activity-type filter.
     try:
         data = await client.get_transactions(
             accounts=accounts,
             asset_classes=asset_classes,
             take=take,
+            sort_column="date",
+            sort_direction="desc",
         )
     except GhostfolioAPIError as e:
         return f"Error fetching transactions: {e}"
@@ -51,20 +62,20 @@ async def transaction_history(
     if not activities:
         return "No transactions found."
 
-    # Client-side filtering by symbol
-    if symbol:
-        symbol_upper = symbol.upper()
-        activities = [
-            a for a in activities
-            if (a.get("SymbolProfile", {}).get("symbol", "") or a.get("symbol", "")).upper() == symbol_upper
-        ]
-
-    # Client-side filtering by activity type
-    if activity_type:
-        type_upper = activity_type.upper()
+    # Client-side filtering by symbol and activity type in a single pass
+    symbol_upper = symbol.upper() if symbol else None
+    type_upper = activity_type.upper() if activity_type else None
+    if symbol_upper or type_upper:
         activities = [
             a for a in activities
-            if (a.get("type", "")).upper() == type_upper
+            if (
+                symbol_upper is None
+                or (
+                    (a.get("SymbolProfile") or {}).get("symbol")
+                    or a.get("symbol", "")
+                ).upper() == symbol_upper
+            )
+            and (type_upper is None or a.get("type", "").upper() == type_upper)
         ]
 
     if not activities:
@@ -75,7 +86,7 @@ async def transaction_history(
             filters.append(f"type={activity_type}")
         return f"No transactions found matching filters: {', '.join(filters)}."
 
-    # Sort by date descending
+    # Sort by date descending (a linear pass when the API already ordered them)
     activities.sort(key=lambda a: a.get("date", ""), reverse=True)
 
     lines = [
@@ -87,16 +98,20 @@ async def transaction_history(
     for a in activities:
         date = a.get("date", "")[:10]
         a_type = a.get("type", "")
-        a_symbol = a.get("SymbolProfile", {}).get("symbol", "") or a.get("symbol", "")
-        name = a.get("SymbolProfile", {}).get("name", "")
+        profile = a.get("SymbolProfile") or {}
+        a_symbol = profile.get("symbol", "") or a.get("symbol", "")
+        name = profile.get("name", "")
         quantity = a.get("quantity", 0)
         unit_price = a.get("unitPrice", 0)
         value = quantity * unit_price
         fee = a.get("fee", 0)
-        currency = a.get("SymbolProfile", {}).get("currency", "") or a.get("currency", "")
-        account_name = a.get("Account", {}).get("name", "") if a.get("Account") else ""
+        currency = profile.get("currency", "") or a.get("currency", "")
+        account_name = (a.get("Account") or {}).get("name", "")
         lines.append(
-            f"| {date} | {a_type} | {a_symbol} | {name} | {quantity:,.4g} | {unit_price:,.2f} | {value:,.2f} | {fee:,.2f} | {currency} | {account_name} |"
+            _ROW_FORMAT(
+                date, a_type, a_symbol, name, quantity,
+                unit_price, value, fee, currency, account_name,
+            )
         )
 
     return "\n".join(lines)
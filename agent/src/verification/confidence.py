@@ -12,7 +12,7 @@ from __future__ import annotations
 import re
 
 # Tools that return authoritative data from Ghostfolio
-DATA_TOOLS = {
+DATA_TOOLS = frozenset({
     "portfolio_analysis",
     "transaction_history",
     "market_data",
@@ -20,12 +20,12 @@ DATA_TOOLS = {
     "benchmark_comparison",
     "dividend_analysis",
     "account_summary",
-}
+})
 
 # Tools that rely on third-party APIs where data quality is less certain
-EXTERNAL_TOOLS = {
+EXTERNAL_TOOLS = frozenset({
     "market_news",
-}
+})
 
 # Hedging language that suggests uncertainty
 _HEDGING_PATTERNS = [
@@ -42,6 +42,7 @@ _HEDGING_PATTERNS = [
     r"\btypically\b",
     r"\bit depends\b",
 ]
+_HEDGING_RES = [re.compile(p) for p in _HEDGING_PATTERNS]
 
 # Patterns indicating the response contains concrete data
 _CONCRETE_DATA_PATTERNS = [
@@ -49,6 +50,7 @@ _CONCRETE_DATA_PATTERNS = [
     r"\d+\.\d+%",             # Percentages with decimals
     r"\b\d{2,}(?:,\d{3})*\b", # Large numbers (100+)
 ]
+_CONCRETE_DATA_RES = [re.compile(p) for p in _CONCRETE_DATA_PATTERNS]
 
 # Patterns in tool output that indicate rate limiting or unavailability
 _EXTERNAL_TOOL_ISSUE_PATTERNS = [
@@ -60,6 +62,7 @@ _EXTERNAL_TOOL_ISSUE_PATTERNS = [
     r"api.?key",
     r"quota",
 ]
+_EXTERNAL_TOOL_ISSUE_RES = [re.compile(p) for p in _EXTERNAL_TOOL_ISSUE_PATTERNS]
 
 # Threshold below which we append a low-confidence caveat
 LOW_CONFIDENCE_THRESHOLD = 0.4
@@ -75,14 +78,14 @@ def _has_external_tool_issues(tool_outputs: list[str]) -> bool:
     for output in tool_outputs:
         if not output:
             continue
+        # Lowercased once so the lowercase, case-sensitive patterns match any casing
         output_lower = output.lower()
         # Check for explicit errors
         if "error" in output_lower[:50]:
             return True
         # Check for rate limiting / unavailability patterns
-        for pattern in _EXTERNAL_TOOL_ISSUE_PATTERNS:
-            if re.search(pattern, output_lower):
-                return True
+        if any(p.search(output_lower) for p in _EXTERNAL_TOOL_ISSUE_RES):
+            return True
     return False
 
 
@@ -109,7 +112,6 @@ def score_confidence(
     Returns:
         (score, detail) where score is 0.0-1.0 and detail explains the rating.
     """
-    response_lower = response.lower()
     tool_outputs = tool_outputs or []
 
     # Start with a base score
@@ -119,21 +121,21 @@ def score_confidence(
     # --- Positive signals ---
 
     # Data tools used (strong signal)
-    data_tools_used = set(tools_used) & DATA_TOOLS
-    if data_tools_used:
+    if any(t in DATA_TOOLS for t in tools_used):
+        data_tools_used = DATA_TOOLS.intersection(tools_used)
         tool_bonus = min(len(data_tools_used) * 0.15, 0.3)
         score += tool_bonus
         factors.append(f"+{tool_bonus:.2f} data tools called ({len(data_tools_used)})")
 
     # Tool outputs present and non-empty (data was actually returned)
-    successful_outputs = [o for o in tool_outputs if o and "error" not in o.lower()[:50]]
+    successful_outputs = [o for o in tool_outputs if o and "error" not in o[:50].lower()]
     if successful_outputs:
         score += 0.1
         factors.append("+0.10 tool outputs received")
 
     # Concrete data in response (numbers, dollar amounts, percentages)
     concrete_count = sum(
-        1 for p in _CONCRETE_DATA_PATTERNS if re.search(p, response)
+        1 for p in _CONCRETE_DATA_RES if p.search(response)
     )
     if concrete_count >= 2:
         score += 0.1
@@ -142,15 +144,19 @@ def score_confidence(
     # --- Negative signals ---
 
     # External tool (market_news) with issues — the only path to the caveat
-    external_tools_used = set(tools_used) & EXTERNAL_TOOLS
-    if external_tools_used and _has_external_tool_issues(tool_outputs):
+    external_issues = (
+        any(t in EXTERNAL_TOOLS for t in tools_used)
+        and _has_external_tool_issues(tool_outputs)
+    )
+    if external_issues:
         score -= 0.3
         factors.append("-0.30 external tool data issues (market_news)")
 
     # Hedging language (informational only — cannot push below threshold
     # unless external tool issues are also present)
+    response_lower = response.lower()
     hedging_count = sum(
-        1 for p in _HEDGING_PATTERNS if re.search(p, response_lower)
+        1 for p in _HEDGING_RES if p.search(response_lower)
     )
     if hedging_count >= 2:
         penalty = min(hedging_count * 0.05, 0.15)
@@ -164,7 +170,7 @@ def score_confidence(
     # were involved with issues.  This ensures conversational responses,
     # Ghostfolio-backed responses, and even hedged responses without
     # external-tool problems never trigger the caveat.
-    if not (external_tools_used and _has_external_tool_issues(tool_outputs)):
+    if not external_issues:
         score = max(score, LOW_CONFIDENCE_THRESHOLD)
 
     detail = f"confidence={score:.2f}"
@@ -15,13 +15,16 @@ DISCLAIMER_PATTERNS = [
     r"disclaimer",
 ]
 
+# Case-sensitive, run over lowercased text: faster than IGNORECASE
+_DISCLAIMER_RES = [re.compile(p) for p in DISCLAIMER_PATTERNS]
+
 # Tool calls that produce financial data requiring a disclaimer
-FINANCIAL_TOOLS = {
+FINANCIAL_TOOLS = frozenset({
     "portfolio_analysis",
     "benchmark_comparison",
     "risk_assessment",
     "dividend_analysis",
-}
+})
 
 
 def check_disclaimer(response: str, tools_used: list[str]) -> tuple[bool, str]:
@@ -32,13 +35,12 @@ def check_disclaimer(response: str, tools_used: list[str]) -> tuple[bool, str]:
         (False, suggestion) if disclaimer is missing.
     """
     # Only require disclaimers when financial analysis tools were used
-    if not set(tools_used) & FINANCIAL_TOOLS:
+    if not any(t in FINANCIAL_TOOLS for t in tools_used):
         return True, ""
 
     response_lower = response.lower()
-    for pattern in DISCLAIMER_PATTERNS:
-        if re.search(pattern, response_lower):
-            return True, ""
+    if any(p.search(response_lower) for p in _DISCLAIMER_RES):
+        return True, ""
 
     return False, (
         "Response uses financial analysis tools but lacks a disclaimer. "
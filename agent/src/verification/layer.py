@@ -6,7 +6,9 @@ to the response before returning it to the user.
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Sequence
 
 from .confidence import LOW_CONFIDENCE_CAVEAT, LOW_CONFIDENCE_THRESHOLD, score_confidence
 from .disclaimer import check_disclaimer
@@ -20,6 +22,13 @@ DISCLAIMER_TEXT = (
     "constitute financial advice.*"
 )
 
+# Identical (response, tools, outputs) inputs recur often — short greetings,
+# retried requests, evals replaying the same case — so verification results
+# are memoized.  Inputs larger than this are verified uncached to keep the
+# cache from pinning large tool outputs in memory.
+_CACHE_MAX_ENTRIES = 256
+_CACHE_MAX_INPUT_CHARS = 32_000
+
 
 def verify_response(
     response: str,
@@ -39,18 +48,57 @@ def verify_response(
             checks: List of check results with name, passed, detail.
             amended: Whether the response was modified.
     """
+    tool_outputs = tool_outputs or []
+    # Only all-str inputs are cached; anything else (e.g. a dict returned by
+    # a tool) is verified directly, as the checks handle it themselves.
+    if (
+        isinstance(response, str)
+        and all(isinstance(t, str) for t in tools_used)
+        and all(isinstance(o, str) for o in tool_outputs)
+        and len(response) + sum(len(o) for o in tool_outputs) <= _CACHE_MAX_INPUT_CHARS
+    ):
+        # Checks don't depend on tool order, so sorting lets reorderings
+        # share a cache entry.
+        result = _verify_cached(response, tuple(sorted(tools_used)), tuple(tool_outputs))
+    else:
+        result = _run_checks(response, tools_used, tool_outputs)
+    final_response, checks, amended, log_records = result
+
+    # Logged here rather than in _run_checks so cache hits still log
+    for level, msg, *log_args in log_records:
+        logger.log(level, msg, *log_args)
+
+    return {
+        "response": final_response,
+        # Copy so callers can't mutate the memoized results
+        "checks": [dict(c) for c in checks],
+        "amended": amended,
+    }
+
+
+def _run_checks(
+    response: str,
+    tools_used: Sequence[str],
+    tool_outputs: Sequence[str],
+) -> tuple[str, tuple[dict, ...], bool, tuple[tuple, ...]]:
+    """Run every check and return (final_response, checks, amended, log_records).
+
+    Side-effect free so it can be memoized; log_records are
+    (level, msg, *args) tuples for the caller to emit.
+    """
     checks = []
     amended = False
     final_response = response
+    log_records = []
 
     # Check 1: Scope — is the response on-topic?
     try:
         passed, detail = check_scope(response, tools_used)
         checks.append({"name": "scope", "passed": passed, "detail": detail})
         if not passed:
-            logger.warning("Scope check failed: %s", detail)
+            log_records.append((logging.WARNING, "Scope check failed: %s", detail))
     except Exception as e:
-        logger.error("Scope check failed: %s", e)
+        log_records.append((logging.ERROR, "Scope check failed: %s", str(e)))
         checks.append({"name": "scope", "passed": True, "detail": f"Check error: {e}"})
 
     # Check 2: Disclaimer
@@ -60,19 +108,19 @@ def verify_response(
         if not passed:
             final_response += DISCLAIMER_TEXT
             amended = True
-            logger.info("Appended missing disclaimer to response")
+            log_records.append((logging.INFO, "Appended missing disclaimer to response"))
     except Exception as e:
-        logger.error("Disclaimer check failed: %s", e)
+        log_records.append((logging.ERROR, "Disclaimer check failed: %s", str(e)))
         checks.append({"name": "disclaimer", "passed": True, "detail": f"Check error: {e}"})
 
     # Check 3: Numeric consistency
     try:
-        passed, detail = check_numeric_consistency(response, tool_outputs or [])
+        passed, detail = check_numeric_consistency(response, tool_outputs)
         checks.append({"name": "numeric_consistency", "passed": passed, "detail": detail})
         if not passed:
-            logger.warning("Numeric consistency issue: %s", detail)
+            log_records.append((logging.WARNING, "Numeric consistency issue: %s", detail))
     except Exception as e:
-        logger.error("Numeric consistency check failed: %s", e)
+        log_records.append((logging.ERROR, "Numeric consistency check failed: %s", str(e)))
         checks.append({"name": "numeric_consistency", "passed": True, "detail": f"Check error: {e}"})
 
     # Check 4: Confidence scoring
@@ -82,17 +130,16 @@ def verify_response(
         if confidence < LOW_CONFIDENCE_THRESHOLD:
             final_response += LOW_CONFIDENCE_CAVEAT
             amended = True
-            logger.info("Appended low-confidence caveat (score=%.2f)", confidence)
+            log_records.append((logging.INFO, "Appended low-confidence caveat (score=%.2f)", confidence))
     except Exception as e:
-        logger.error("Confidence scoring failed: %s", e)
+        log_records.append((logging.ERROR, "Confidence scoring failed: %s", str(e)))
         checks.append({"name": "confidence", "passed": True, "detail": f"Check error: {e}"})
 
     # Check 5: Ticker verification is done at tool-call time (create_order.py)
     # Record it as always-passed here since it's enforced upstream
     checks.append({"name": "ticker_verification", "passed": True, "detail": "Enforced at tool-call time"})
 
-    return {
-        "response": final_response,
-        "checks": checks,
-        "amended": amended,
-    }
+    return final_response, tuple(checks), amended, tuple(log_records)
+
+
+_verify_cached = functools.lru_cache(maxsize=_CACHE_MAX_ENTRIES)(_run_checks)
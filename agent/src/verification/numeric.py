@@ -6,16 +6,25 @@ from __future__ import annotations
 import re
 
 
+# Numbers with 2+ integer digits are captured; 1-digit numbers are still
+# consumed (so "5.25" never yields "25") but leave the group empty.
+_NUMBER_PATTERN = re.compile(r"(-?\d,*\d[\d,]*\.?\d*)|-?\d[\d,]*\.?\d*")
+
+
 def _extract_numbers(text: str) -> set[str]:
     """Extract significant numbers (2+ digits) from text, normalized."""
-    raw = re.findall(r"-?\d[\d,]*\.?\d*", text)
-    normalized = set()
-    for n in raw:
-        clean = n.replace(",", "")
-        # Skip trivially small numbers (1-digit integers)
-        if clean.lstrip("-") and len(clean.lstrip("-").split(".")[0]) >= 2:
-            normalized.add(clean)
-    return normalized
+    return {n.replace(",", "") for n in _NUMBER_PATTERN.findall(text) if n}
+
+
+def _contains_any(number: str, candidates: set[str]) -> bool:
+    """Return True if any of *candidates* is a substring of *number*."""
+    # Extracted numbers are at least 2 characters long
+    n = len(number)
+    return any(
+        number[i:j] in candidates
+        for i in range(n - 1)
+        for j in range(i + 2, n + 1)
+    )
 
 
 def check_numeric_consistency(
@@ -44,20 +53,23 @@ def check_numeric_consistency(
     if not tool_numbers:
         return True, ""
 
-    # Check each response number against tool numbers
-    # Allow for formatting differences (52,450.00 vs 52450.0)
+    # Check each response number against tool numbers, allowing for
+    # formatting differences (52,450.00 vs 52450.0) and rounding/truncation
+    # (52450 vs 52450.37).  Each test is a hash or single-buffer lookup
+    # rather than a scan over every tool number.
+    tool_bases = {tn.rstrip("0").rstrip(".") for tn in tool_numbers}
+    # Newline-separated so a substring hit can't straddle two numbers
+    tool_blob = "\n".join(tool_numbers)
+
     unmatched = []
     for rn in response_numbers:
-        # Try exact match and truncated match
-        rn_base = rn.rstrip("0").rstrip(".")
-        matched = False
-        for tn in tool_numbers:
-            tn_base = tn.rstrip("0").rstrip(".")
-            if rn_base == tn_base or rn in tn or tn in rn:
-                matched = True
-                break
-        if not matched:
-            unmatched.append(rn)
+        if (
+            rn.rstrip("0").rstrip(".") in tool_bases
+            or rn in tool_blob
+            or _contains_any(rn, tool_numbers)
+        ):
+            continue
+        unmatched.append(rn)
 
     if not unmatched:
         return True, ""
@@ -38,6 +38,10 @@ _AMBIGUOUS_SIGNALS = [
     r"\bpreference\b",
 ]
 
+_UNAMBIGUOUS_RES = [re.compile(p) for p in _UNAMBIGUOUS_SIGNALS]
+_AMBIGUOUS_RES = [re.compile(p) for p in _AMBIGUOUS_SIGNALS]
+_WEIGHTED_SIGNALS = ((2, _UNAMBIGUOUS_RES), (1, _AMBIGUOUS_RES))
+
 # Phrases indicating the agent correctly declined an off-topic request
 DECLINED_PATTERNS = [
     r"portfolio assistant",
@@ -47,9 +51,10 @@ DECLINED_PATTERNS = [
     r"not (?:able|designed) to",
     r"(?:unrelated|off.topic)",
 ]
+_DECLINED_RES = [re.compile(p) for p in DECLINED_PATTERNS]
 
 # If none of these tools were called AND no on-topic signals found, likely off-topic
-PORTFOLIO_TOOLS = {
+PORTFOLIO_TOOLS = frozenset({
     "portfolio_analysis",
     "transaction_history",
     "market_data",
@@ -62,7 +67,7 @@ PORTFOLIO_TOOLS = {
     "get_user_preferences",
     "save_user_preference",
     "delete_user_preference",
-}
+})
 
 
 def check_scope(response: str, tools_used: list[str]) -> tuple[bool, str]:
@@ -72,33 +77,34 @@ def check_scope(response: str, tools_used: list[str]) -> tuple[bool, str]:
         (True, "") if on-topic or correctly declined.
         (False, detail) if the response appears off-topic.
     """
-    response_lower = response.lower()
-
     # If tools were used, the agent engaged with portfolio data — on-topic
-    if set(tools_used) & PORTFOLIO_TOOLS:
+    if any(t in PORTFOLIO_TOOLS for t in tools_used):
         return True, ""
 
+    # Short responses (greetings, acknowledgements) are fine.  Checked before
+    # any regex work since every other path would also pass them.
+    if len(response.split()) < 20:
+        return True, ""
+
+    response_lower = response.lower()
+
     # If the agent declined the request, that's correct behavior
-    for pattern in DECLINED_PATTERNS:
-        if re.search(pattern, response_lower):
+    for pattern in _DECLINED_RES:
+        if pattern.search(response_lower):
             return True, ""
 
     # No tools used and no decline — check for on-topic content signals.
     # Unambiguous financial terms count as 2, ambiguous ones count as 1.
-    score = sum(
-        2 for p in _UNAMBIGUOUS_SIGNALS if re.search(p, response_lower)
-    ) + sum(
-        1 for p in _AMBIGUOUS_SIGNALS if re.search(p, response_lower)
-    )
-
     # Require a score of at least 3 (e.g. one unambiguous + one ambiguous,
-    # or three ambiguous) to be confident the response is on-topic.
-    if score >= 3:
-        return True, ""
-
-    # Short responses (greetings, acknowledgements) are fine
-    if len(response.split()) < 20:
-        return True, ""
+    # or three ambiguous) to be confident the response is on-topic, and stop
+    # scanning as soon as that threshold is reached.
+    score = 0
+    for weight, patterns in _WEIGHTED_SIGNALS:
+        for p in patterns:
+            if p.search(response_lower):
+                score += weight
+                if score >= 3:
+                    return True, ""
 
     return False, (
         "Response may be off-topic: no portfolio tools were called and "
@@ -2,8 +2,25 @@
 
 from __future__ import annotations
 
+import time
+
 from ..client import GhostfolioAPIError, GhostfolioClient
 
+# Positive verifications are cached per process — the same handful of
+# tickers recur across a session.  Failures are never cached since they may
+# reflect a transient upstream outage.
+_VERIFIED_TTL_SECONDS = 3600
+_VERIFIED_MAX_ENTRIES = 2048
+_verified_symbols: dict[tuple[str, str], float] = {}
+
+
+def _remember_verified(key: tuple[str, str]) -> None:
+    """Record *key* as verified, evicting the oldest entry when full."""
+    _verified_symbols.pop(key, None)
+    if len(_verified_symbols) >= _VERIFIED_MAX_ENTRIES:
+        del _verified_symbols[next(iter(_verified_symbols))]
+    _verified_symbols[key] = time.monotonic() + _VERIFIED_TTL_SECONDS
+
 
 async def verify_ticker(
     client: GhostfolioClient,
@@ -20,10 +37,16 @@ async def verify_ticker(
     if not symbol:
         return False, "Symbol is empty."
 
+    key = (data_source, symbol)
+    expires = _verified_symbols.get(key)
+    if expires is not None and expires > time.monotonic():
+        return True, ""
+
     # 1. Try direct profile lookup (fast path)
     try:
         profile = await client.get_symbol_profile(data_source, symbol)
         if profile and profile.get("symbol"):
+            _remember_verified(key)
             return True, ""
     except GhostfolioAPIError as e:
         if e.status_code not in (None, 404):
@@ -44,6 +67,7 @@ async def verify_ticker(
     # Check if any search result matches the exact symbol
     exact = [i for i in items if i.get("symbol", "").upper() == symbol]
     if exact:
+        _remember_verified(key)
         return True, ""
 
     # Symbol not exact-matched but similar results exist — suggest alternatives
@@ -6,12 +6,21 @@ import httpx
 
 from src.client import GhostfolioClient
 from src.memory import MemoryStore
+from src.verification import ticker
 
 
 BASE_URL = "http://ghostfolio.test"
 AUTH_TOKEN = "test-token-123"
 
 
+@pytest.fixture(autouse=True)
+def _clear_ticker_cache():
+    """Keep verify_ticker's process-wide cache from leaking between tests."""
+    ticker._verified_symbols.clear()
+    yield
+    ticker._verified_symbols.clear()
+
+
 @pytest.fixture
 def mock_api():
     """RESPX router scoped to the test Ghostfolio base URL."""
@@ -19,13 +28,24 @@ def mock_api():
         yield router
 
 
-@pytest.fixture
-async def client(mock_api):
-    """GhostfolioClient wired to the mocked base URL."""
+@pytest.fixture(scope="session")
+async def _shared_client():
+    """One GhostfolioClient for the whole session.
+
+    Building an httpx.AsyncClient (and its SSL context) costs tens of
+    milliseconds; respx patches the transport per test, so the same client
+    is safely reused behind each test's mock router.
+    """
     async with GhostfolioClient(base_url=BASE_URL, auth_token=AUTH_TOKEN) as c:
         yield c
 
 
+@pytest.fixture
+def client(mock_api, _shared_client):
+    """GhostfolioClient wired to the mocked base URL."""
+    return _shared_client
+
+
 @pytest.fixture
 def memory_store():
     """In-memory MemoryStore for testing (no Redis)."""
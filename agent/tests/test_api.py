@@ -1,32 +1,82 @@
 """Tests for the FastAPI /chat and /health endpoints."""
 
 import pytest
+import respx
 from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessage
 
+from src import main
 from src.main import app
 
 
-def test_health():
+@pytest.fixture(scope="module")
+def app_client():
+    """TestClient shared across this module so app startup runs once."""
     with TestClient(app) as tc:
-        resp = tc.get("/health")
+        yield tc
+
+
+def test_health(app_client):
+    resp = app_client.get("/health")
     assert resp.status_code == 200
     data = resp.json()
     assert data["status"] == "ok"
     assert "tracing" in data
 
 
-def test_chat_missing_auth():
-    with TestClient(app) as tc:
-        resp = tc.post("/chat", json={"message": "hello"})
+def test_chat_missing_auth(app_client):
+    resp = app_client.post("/chat", json={"message": "hello"})
     # FastAPI returns 422 when required header is missing
     assert resp.status_code == 422
 
 
-def test_chat_empty_bearer():
-    with TestClient(app) as tc:
-        resp = tc.post(
-            "/chat",
-            json={"message": "hello"},
-            headers={"Authorization": "Bearer "},
-        )
+def test_chat_empty_bearer(app_client):
+    resp = app_client.post(
+        "/chat",
+        json={"message": "hello"},
+        headers={"Authorization": "Bearer "},
+    )
     assert resp.status_code == 401
+
+
+class _ReportAgent:
+    """Stand-in agent that makes one Ghostfolio call through the shared pool."""
+
+    async def ainvoke(self, state, config):
+        report = await config["configurable"]["client"].get_portfolio_report()
+        return {"messages": [AIMessage(content=f"Report has {len(report['xRay']['categories'])} categories.")]}
+
+
+def test_chat_reaches_ghostfolio_after_restart(monkeypatch):
+    monkeypatch.setattr(main, "agent", _ReportAgent())
+    with respx.mock(base_url=main.GHOSTFOLIO_BASE_URL, assert_all_called=False) as router:
+        router.get("/api/v1/portfolio/report").respond(200, json={"xRay": {"categories": []}})
+        # Startup twice on the same app, as a restarted server would
+        for _ in range(2):
+            with TestClient(app) as tc:
+                resp = tc.post(
+                    "/chat",
+                    json={"message": "Check my risk", "session_id": "lifespan-restart"},
+                    headers={"Authorization": "Bearer test-token"},
+                )
+            assert resp.status_code == 200
+            assert resp.json()["content"].startswith("Report has 0 categories.")
+        assert router.calls.call_count == 2
+
+
+def test_shared_pool_does_not_replay_cookies(monkeypatch):
+    monkeypatch.setattr(main, "agent", _ReportAgent())
+    with respx.mock(base_url=main.GHOSTFOLIO_BASE_URL, assert_all_called=False) as router:
+        router.get("/api/v1/portfolio/report").respond(
+            200, json={"xRay": {"categories": []}}, headers={"Set-Cookie": "sid=userA; Path=/"}
+        )
+        with TestClient(app) as tc:
+            for token in ("user-a-token", "user-b-token"):
+                resp = tc.post(
+                    "/chat",
+                    json={"message": "Check my risk", "session_id": f"cookies-{token}"},
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+                assert resp.status_code == 200
+        assert router.calls.call_count == 2
+        assert "cookie" not in router.calls[1].request.headers
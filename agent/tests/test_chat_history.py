@@ -7,7 +7,12 @@ import pytest
 from langchain_core.messages import AIMessage, HumanMessage
 
 from src.main import _resolve_context
-from src.memory.chat_history import ChatHistoryStore, _chat_key, _extract_user_id
+from src.memory.chat_history import (
+    CHAT_TTL_SECONDS,
+    ChatHistoryStore,
+    _chat_key,
+    _extract_user_id,
+)
 
 
 def _make_jwt(payload: dict) -> str:
@@ -21,11 +26,45 @@ AUTH_TOKEN = "test-token-123"
 OTHER_TOKEN = "other-user-456"
 
 
+class FakeRedis:
+    """Minimal async Redis double recording RPUSH/EXPIRE calls."""
+
+    def __init__(self):
+        self.lists: dict[str, list[bytes]] = {}
+        self.rpush_calls: list[tuple] = []
+        self.expire_calls: list[tuple[str, int]] = []
+
+    async def rpush(self, key, *values):
+        self.rpush_calls.append((key, *values))
+        self.lists.setdefault(key, []).extend(v.encode() for v in values)
+        return len(self.lists[key])
+
+    async def expire(self, key, seconds):
+        self.expire_calls.append((key, seconds))
+        return True
+
+    async def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        # Redis LRANGE end is inclusive; -1 means the last element
+        stop = len(items) if end == -1 else end + 1
+        return items[start:stop]
+
+
 @pytest.fixture
 def store():
     return ChatHistoryStore()
 
 
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def redis_store(fake_redis):
+    return ChatHistoryStore(redis_client=fake_redis)
+
+
 class TestChatHistoryStore:
     async def test_empty_history(self, store):
         result = await store.get_history(AUTH_TOKEN)
@@ -46,8 +85,7 @@ class TestChatHistoryStore:
             ("user", "Second"),
             ("agent", "Response 2"),
         ]
-        for role, content in messages:
-            await store.append_message(AUTH_TOKEN, role, content)
+        await store.append_messages(AUTH_TOKEN, messages)
 
         history = await store.get_history(AUTH_TOKEN)
         assert len(history) == 4
@@ -55,6 +93,22 @@ class TestChatHistoryStore:
             assert history[i]["role"] == role
             assert history[i]["content"] == content
 
+    async def test_get_history_limit_returns_most_recent(self, store):
+        await store.append_messages(
+            AUTH_TOKEN, [("user", "First"), ("agent", "Second"), ("user", "Third")]
+        )
+        history = await store.get_history(AUTH_TOKEN, limit=2)
+        assert [m["content"] for m in history] == ["Second", "Third"]
+        assert len(await store.get_history(AUTH_TOKEN)) == 3
+
+    async def test_get_history_limit_zero_returns_nothing(self, store):
+        await store.append_messages(AUTH_TOKEN, [("user", "First"), ("agent", "Second")])
+        assert await store.get_history(AUTH_TOKEN, limit=0) == []
+
+    async def test_append_messages_empty_is_noop(self, store):
+        await store.append_messages(AUTH_TOKEN, [])
+        assert await store.get_history(AUTH_TOKEN) == []
+
     async def test_clear_history(self, store):
         await store.append_message(AUTH_TOKEN, "user", "Hello")
         await store.append_message(AUTH_TOKEN, "agent", "Hi!")
@@ -97,6 +151,32 @@ class TestChatHistoryStore:
         assert history[0]["content"] == content
 
 
+class TestChatHistoryStoreRedis:
+    async def test_append_messages_uses_single_rpush(self, redis_store, fake_redis):
+        await redis_store.append_messages(
+            AUTH_TOKEN, [("user", "Hello"), ("agent", "Hi there!")]
+        )
+        key = _chat_key(AUTH_TOKEN)
+        assert fake_redis.rpush_calls == [
+            (
+                key,
+                json.dumps({"role": "user", "content": "Hello"}),
+                json.dumps({"role": "agent", "content": "Hi there!"}),
+            )
+        ]
+        assert fake_redis.expire_calls == [(key, CHAT_TTL_SECONDS)]
+
+    async def test_get_history_limit_returns_tail_in_order(self, redis_store, fake_redis):
+        await redis_store.append_messages(
+            AUTH_TOKEN,
+            [("user", "First"), ("agent", "Second"), ("user", "Third"), ("agent", "Fourth")],
+        )
+        history = await redis_store.get_history(AUTH_TOKEN, limit=2)
+        assert [m["content"] for m in history] == ["Third", "Fourth"]
+        assert len(await redis_store.get_history(AUTH_TOKEN)) == 4
+        assert fake_redis.expire_calls[-1] == (_chat_key(AUTH_TOKEN), CHAT_TTL_SECONDS)
+
+
 class TestExtractUserId:
     def test_extracts_id_from_jwt(self):
         jwt = _make_jwt({"id": "user-abc-123"})
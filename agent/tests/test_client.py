@@ -19,6 +19,41 @@ async def test_client_context_manager():
     assert c._http.is_closed
 
 
+@pytest.mark.asyncio
+async def test_shared_http_client_left_open(mock_api):
+    """A caller-supplied pool is used for requests but not closed on exit."""
+    mock_api.get("/api/v1/account").mock(
+        return_value=httpx.Response(200, json={"accounts": []})
+    )
+    async with httpx.AsyncClient(base_url=BASE_URL) as http:
+        async with GhostfolioClient(
+            base_url=BASE_URL, auth_token="other-token", http_client=http
+        ) as c:
+            await c.get_accounts()
+        assert not http.is_closed
+    req = mock_api.calls[0].request
+    assert req.headers["authorization"] == "Bearer other-token"
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_base_url_mismatch():
+    """A shared pool pointing elsewhere is rejected rather than ignored."""
+    async with httpx.AsyncClient(base_url="http://elsewhere.test") as http:
+        with pytest.raises(ValueError):
+            GhostfolioClient(base_url=BASE_URL, auth_token=AUTH_TOKEN, http_client=http)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "base_url",
+    ["http://ghostfolio:80", "https://host:443", "http://Ghostfolio:3333", "http://ghostfolio:3333/"],
+)
+async def test_shared_http_client_base_url_normalized(base_url):
+    """httpx's normalization of the pool URL (host case, default port) still matches."""
+    async with httpx.AsyncClient(base_url=base_url) as http:
+        GhostfolioClient(base_url=base_url, auth_token=AUTH_TOKEN, http_client=http)
+
+
 @pytest.mark.asyncio
 async def test_client_sends_auth_header(mock_api, client):
     mock_api.get("/api/v1/account").mock(
@@ -48,6 +83,18 @@ async def test_get_transactions(mock_api, client):
     assert len(result["activities"]) == 1
 
 
+@pytest.mark.asyncio
+async def test_get_transactions_sort_params(mock_api, client):
+    route = mock_api.get("/api/v1/order").mock(
+        return_value=httpx.Response(200, json={"activities": []})
+    )
+    await client.get_transactions(take=10, sort_column="date", sort_direction="desc")
+    params = route.calls[0].request.url.params
+    assert params["sortColumn"] == "date"
+    assert params["sortDirection"] == "desc"
+    assert params["take"] == "10"
+
+
 @pytest.mark.asyncio
 async def test_symbol_lookup(mock_api, client):
     mock_api.get("/api/v1/symbol/lookup").mock(
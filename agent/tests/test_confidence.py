@@ -55,13 +55,13 @@ class TestScoreConfidence:
         )
         assert score >= LOW_CONFIDENCE_THRESHOLD
 
-    def test_greeting_no_low_confidence(self):
+    @pytest.mark.parametrize(
+        "greeting", ["Hi!", "Hello", "Hey, how are you?", "Good morning!"]
+    )
+    def test_greeting_no_low_confidence(self, greeting):
         """Greetings like 'hi' should never show the low-confidence caveat."""
-        for greeting in ["Hi!", "Hello", "Hey, how are you?", "Good morning!"]:
-            score, _ = score_confidence(greeting, [], [])
-            assert score >= LOW_CONFIDENCE_THRESHOLD, (
-                f"Greeting '{greeting}' got score {score}, expected >= {LOW_CONFIDENCE_THRESHOLD}"
-            )
+        score, _ = score_confidence(greeting, [], [])
+        assert score >= LOW_CONFIDENCE_THRESHOLD
 
     def test_no_tools_no_penalty(self):
         """No tools called = base confidence (no penalty)."""
@@ -103,34 +103,30 @@ class TestScoreConfidence:
 
     # --- market_news with errors (the ONLY path to the caveat) ---
 
-    def test_market_news_with_errors_triggers_caveat(self):
-        """market_news tool with error outputs should drop below threshold."""
-        score, detail = score_confidence(
-            "Here is the latest market news for today.",
-            ["market_news"],
-            ["Error: AlphaVantage API rate limit exceeded"],
-        )
+    @pytest.mark.parametrize(
+        ("response", "output"),
+        [
+            (
+                "Here is the latest market news for today.",
+                "Error: AlphaVantage API rate limit exceeded",
+            ),
+            (
+                "I found some market news but data may be incomplete.",
+                "Rate limit reached. Only partial results returned.",
+            ),
+            (
+                "Market news request timed out.",
+                "Request timed out after 30 seconds",
+            ),
+        ],
+        ids=["error", "rate_limit", "timeout"],
+    )
+    def test_market_news_issues_trigger_caveat(self, response, output):
+        """market_news with error, rate-limit or timeout output drops below threshold."""
+        score, detail = score_confidence(response, ["market_news"], [output])
         assert score < LOW_CONFIDENCE_THRESHOLD
         assert "external tool data issues" in detail
 
-    def test_market_news_with_rate_limit_triggers_caveat(self):
-        """market_news with rate-limiting output drops below threshold."""
-        score, _ = score_confidence(
-            "I found some market news but data may be incomplete.",
-            ["market_news"],
-            ["Rate limit reached. Only partial results returned."],
-        )
-        assert score < LOW_CONFIDENCE_THRESHOLD
-
-    def test_market_news_with_timeout_triggers_caveat(self):
-        """market_news with timeout output drops below threshold."""
-        score, _ = score_confidence(
-            "Market news request timed out.",
-            ["market_news"],
-            ["Request timed out after 30 seconds"],
-        )
-        assert score < LOW_CONFIDENCE_THRESHOLD
-
     def test_market_news_successful_no_caveat(self):
         """market_news with successful outputs should NOT trigger caveat."""
         score, _ = score_confidence(
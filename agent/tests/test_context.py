@@ -5,6 +5,18 @@ from langchain_core.messages import AIMessage, HumanMessage
 
 from src.main import MAX_HISTORY_MESSAGES, trim_messages
 
+_BIG_COUNT = MAX_HISTORY_MESSAGES + 20
+
+
+@pytest.fixture(scope="module")
+def big_messages():
+    """Message list over the history limit, built once for the module.
+
+    trim_messages only slices, so tests may share this list as long as
+    they never mutate it.
+    """
+    return [HumanMessage(content=f"msg-{i}") for i in range(_BIG_COUNT)]
+
 
 class TestTrimMessages:
     def test_no_trim_when_under_limit(self):
@@ -13,19 +25,17 @@ class TestTrimMessages:
         assert len(result) == 10
         assert result is messages  # same list, no copy
 
-    def test_no_trim_at_exact_limit(self):
-        messages = [HumanMessage(content=f"msg-{i}") for i in range(MAX_HISTORY_MESSAGES)]
+    def test_no_trim_at_exact_limit(self, big_messages):
+        messages = big_messages[:MAX_HISTORY_MESSAGES]
         result = trim_messages(messages)
         assert len(result) == MAX_HISTORY_MESSAGES
 
-    def test_trims_oldest_messages(self):
-        count = MAX_HISTORY_MESSAGES + 20
-        messages = [HumanMessage(content=f"msg-{i}") for i in range(count)]
-        result = trim_messages(messages)
+    def test_trims_oldest_messages(self, big_messages):
+        result = trim_messages(big_messages)
         assert len(result) == MAX_HISTORY_MESSAGES
         # Should keep the most recent messages
-        assert result[0].content == f"msg-{count - MAX_HISTORY_MESSAGES}"
-        assert result[-1].content == f"msg-{count - 1}"
+        assert result[0].content == f"msg-{_BIG_COUNT - MAX_HISTORY_MESSAGES}"
+        assert result[-1].content == f"msg-{_BIG_COUNT - 1}"
 
     def test_custom_max(self):
         messages = [HumanMessage(content=f"msg-{i}") for i in range(10)]
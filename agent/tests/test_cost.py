@@ -1,5 +1,7 @@
 """Tests for cost analysis module."""
 
+import pytest
+
 from src.observability.cost import calculate_cost, calculate_batch_cost, MODEL_PRICING
 
 
@@ -10,36 +12,31 @@ class TestCalculateCost:
         assert result["input_cost_usd"] == 0
         assert result["output_cost_usd"] == 0
 
-    def test_gpt4o_pricing(self):
-        # 1000 input tokens at $2.50/1M = $0.0025
-        # 500 output tokens at $10.00/1M = $0.005
-        result = calculate_cost(1000, 500, model="gpt-4o")
-        assert result["model"] == "gpt-4o"
-        assert result["input_cost_usd"] == 0.0025
-        assert result["output_cost_usd"] == 0.005
-        assert result["total_cost_usd"] == 0.0075
-
-    def test_gpt4o_mini_pricing(self):
-        # 1000 input tokens at $0.15/1M = $0.00015
-        # 500 output tokens at $0.60/1M = $0.0003
-        result = calculate_cost(1000, 500, model="gpt-4o-mini")
-        assert result["model"] == "gpt-4o-mini"
-        assert result["input_cost_usd"] == 0.00015
-        assert result["output_cost_usd"] == 0.0003
-        assert result["total_cost_usd"] == 0.00045
+    @pytest.mark.parametrize(
+        ("input_tokens", "output_tokens", "model", "expected"),
+        [
+            # $2.50/1M input, $10.00/1M output
+            (1000, 500, "gpt-4o", (0.0025, 0.005, 0.0075)),
+            # $0.15/1M input, $0.60/1M output
+            (1000, 500, "gpt-4o-mini", (0.00015, 0.0003, 0.00045)),
+            (1_000_000, 1_000_000, "gpt-4o", (2.5, 10.0, 12.5)),
+        ],
+        ids=["gpt-4o", "gpt-4o-mini", "gpt-4o-1M"],
+    )
+    def test_model_pricing(self, input_tokens, output_tokens, model, expected):
+        result = calculate_cost(input_tokens, output_tokens, model=model)
+        assert result["model"] == model
+        assert (
+            result["input_cost_usd"],
+            result["output_cost_usd"],
+            result["total_cost_usd"],
+        ) == expected
 
     def test_unknown_model_uses_default(self):
         result = calculate_cost(1000, 500, model="unknown-model")
         default_result = calculate_cost(1000, 500, model="gpt-4o")
         assert result["total_cost_usd"] == default_result["total_cost_usd"]
 
-    def test_large_token_count(self):
-        # 1M input tokens = $2.50, 1M output tokens = $10.00
-        result = calculate_cost(1_000_000, 1_000_000, model="gpt-4o")
-        assert result["input_cost_usd"] == 2.5
-        assert result["output_cost_usd"] == 10.0
-        assert result["total_cost_usd"] == 12.5
-
     def test_returns_token_counts(self):
         result = calculate_cost(1500, 800)
         assert result["input_tokens"] == 1500
@@ -59,26 +56,35 @@ class TestCalculateBatchCost:
         assert result["total_cost_usd"] == 0
         assert result["avg_cost_per_request_usd"] == 0
 
-    def test_single_request(self):
+    @pytest.mark.parametrize(
+        ("requests", "expected_input", "expected_output"),
+        [
+            ([{"input_tokens": 1000, "output_tokens": 500}], 1000, 500),
+            (
+                [
+                    {"input_tokens": 1000, "output_tokens": 500},
+                    {"input_tokens": 2000, "output_tokens": 1000},
+                    {"input_tokens": 3000, "output_tokens": 1500},
+                ],
+                6000,
+                3000,
+            ),
+        ],
+        ids=["single", "multiple"],
+    )
+    def test_totals(self, requests, expected_input, expected_output):
+        result = calculate_batch_cost(requests)
+        assert result["request_count"] == len(requests)
+        assert result["total_input_tokens"] == expected_input
+        assert result["total_output_tokens"] == expected_output
+        assert len(result["per_request"]) == len(requests)
+
+    def test_single_request_avg_equals_total(self):
         result = calculate_batch_cost([
             {"input_tokens": 1000, "output_tokens": 500},
         ])
-        assert result["request_count"] == 1
-        assert result["total_input_tokens"] == 1000
-        assert result["total_output_tokens"] == 500
         assert result["total_cost_usd"] == result["avg_cost_per_request_usd"]
 
-    def test_multiple_requests(self):
-        result = calculate_batch_cost([
-            {"input_tokens": 1000, "output_tokens": 500},
-            {"input_tokens": 2000, "output_tokens": 1000},
-            {"input_tokens": 3000, "output_tokens": 1500},
-        ])
-        assert result["request_count"] == 3
-        assert result["total_input_tokens"] == 6000
-        assert result["total_output_tokens"] == 3000
-        assert len(result["per_request"]) == 3
-
     def test_avg_cost_calculation(self):
         result = calculate_batch_cost([
             {"input_tokens": 1000, "output_tokens": 500},
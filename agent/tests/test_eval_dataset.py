@@ -1,6 +1,7 @@
 """Tests for eval dataset validation."""
 
 import json
+from collections import Counter
 from pathlib import Path
 
 import pytest
@@ -23,8 +24,9 @@ def load_all_cases() -> list[dict]:
     return cases
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def all_cases():
+    """Dataset cases, loaded once; tests only read them."""
     return load_all_cases()
 
 
@@ -39,8 +41,9 @@ class TestDatasetStructure:
             assert not missing, f"Case {case.get('id', '?')} missing fields: {missing}"
 
     def test_all_ids_unique(self, all_cases):
-        ids = [c["id"] for c in all_cases]
-        assert len(ids) == len(set(ids)), f"Duplicate IDs found: {[x for x in ids if ids.count(x) > 1]}"
+        counts = Counter(c["id"] for c in all_cases)
+        dupes = [i for i, n in counts.items() if n > 1]
+        assert not dupes, f"Duplicate IDs found: {dupes}"
 
     def test_all_checks_are_valid(self, all_cases):
         for case in all_cases:
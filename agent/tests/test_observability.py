@@ -1,6 +1,7 @@
 """Tests for the observability module."""
 
 import os
+from dataclasses import dataclass
 
 import pytest
 
@@ -8,6 +9,14 @@ from src.observability.tracing import configure_tracing, get_run_config, is_trac
 from src.observability.metrics import extract_metrics
 
 
+@dataclass(frozen=True, slots=True)
+class _FakeAIMessage:
+    """Stand-in for an AIMessage with just the fields extract_metrics reads."""
+
+    response_metadata: dict
+    tool_calls: list | None = None
+
+
 class TestConfigureTracing:
     def test_enabled_when_env_set(self, monkeypatch):
         monkeypatch.setenv("LANGCHAIN_TRACING_V2", "true")
@@ -67,47 +76,48 @@ class TestExtractMetrics:
         assert metrics["message_count"] == 0
 
     def test_with_token_usage(self):
-        class FakeAIMessage:
-            response_metadata = {
+        msg = _FakeAIMessage(
+            response_metadata={
                 "token_usage": {
                     "prompt_tokens": 100,
                     "completion_tokens": 50,
                     "total_tokens": 150,
                 }
             }
-            tool_calls = None
+        )
 
-        metrics = extract_metrics({"messages": [FakeAIMessage()]})
+        metrics = extract_metrics({"messages": [msg]})
         assert metrics["input_tokens"] == 100
         assert metrics["output_tokens"] == 50
         assert metrics["total_tokens"] == 150
 
     def test_with_tool_calls(self):
-        class FakeAIMessage:
-            response_metadata = {"token_usage": {}}
-            tool_calls = [
+        msg = _FakeAIMessage(
+            response_metadata={"token_usage": {}},
+            tool_calls=[
                 {"name": "portfolio_analysis"},
                 {"name": "market_data"},
-            ]
+            ],
+        )
 
-        metrics = extract_metrics({"messages": [FakeAIMessage()]})
+        metrics = extract_metrics({"messages": [msg]})
         assert metrics["tool_call_count"] == 2
         assert metrics["tools_used"] == ["portfolio_analysis", "market_data"]
 
     def test_multiple_messages(self):
-        class Msg1:
-            response_metadata = {
+        msg1 = _FakeAIMessage(
+            response_metadata={
                 "token_usage": {"prompt_tokens": 50, "completion_tokens": 25, "total_tokens": 75}
-            }
-            tool_calls = [{"name": "market_data"}]
-
-        class Msg2:
-            response_metadata = {
+            },
+            tool_calls=[{"name": "market_data"}],
+        )
+        msg2 = _FakeAIMessage(
+            response_metadata={
                 "token_usage": {"prompt_tokens": 80, "completion_tokens": 40, "total_tokens": 120}
-            }
-            tool_calls = None
+            },
+        )
 
-        metrics = extract_metrics({"messages": [Msg1(), Msg2()]})
+        metrics = extract_metrics({"messages": [msg1, msg2]})
         assert metrics["input_tokens"] == 130
         assert metrics["output_tokens"] == 65
         assert metrics["total_tokens"] == 195
@@ -2,7 +2,6 @@
 
 import httpx
 import pytest
-import respx
 
 from src.tools.portfolio import portfolio_analysis
 from src.tools.transactions import transaction_history
@@ -58,6 +57,10 @@ async def test_portfolio_analysis_error(mock_api, tool_config):
     mock_api.get("/api/v1/portfolio/details").mock(
         return_value=httpx.Response(500, text="Server Error")
     )
+    # Both endpoints are requested concurrently
+    mock_api.get("/api/v2/portfolio/performance").mock(
+        return_value=httpx.Response(200, json={"performance": {}})
+    )
     result = await portfolio_analysis.ainvoke({}, config=tool_config)
     assert "Error" in result
 
@@ -84,6 +87,43 @@ async def test_transaction_history_success(mock_api, tool_config):
     assert "BUY" in result
 
 
+@pytest.mark.asyncio
+async def test_transaction_history_filters_and_sorts(mock_api, tool_config):
+    mock_api.get("/api/v1/order").mock(
+        return_value=httpx.Response(200, json={
+            "activities": [
+                {
+                    "id": "tx-1", "type": "BUY", "date": "2024-01-01T00:00:00Z",
+                    "quantity": 1, "unitPrice": 100, "fee": 0,
+                    "SymbolProfile": {"symbol": "AAPL", "currency": "USD"},
+                },
+                {
+                    "id": "tx-2", "type": "SELL", "date": "2024-02-01T00:00:00Z",
+                    "quantity": 1, "unitPrice": 110, "fee": 0,
+                    "SymbolProfile": {"symbol": "AAPL", "currency": "USD"},
+                },
+                {
+                    "id": "tx-3", "type": "BUY", "date": "2024-03-01T00:00:00Z",
+                    "quantity": 2, "unitPrice": 300, "fee": 0,
+                    "SymbolProfile": {"symbol": "MSFT", "currency": "USD"},
+                },
+                {
+                    "id": "tx-4", "type": "BUY", "date": "2024-04-01T00:00:00Z",
+                    "quantity": 3, "unitPrice": 120, "fee": 0,
+                    "SymbolProfile": {"symbol": "AAPL", "currency": "USD"},
+                },
+            ]
+        })
+    )
+    result = await transaction_history.ainvoke(
+        {"symbol": "aapl", "activity_type": "buy"}, config=tool_config
+    )
+    assert "showing 2 activities" in result
+    assert "MSFT" not in result
+    assert "SELL" not in result
+    assert result.index("2024-04-01") < result.index("2024-01-01")
+
+
 @pytest.mark.asyncio
 async def test_transaction_history_empty(mock_api, tool_config):
     mock_api.get("/api/v1/order").mock(
@@ -185,6 +225,27 @@ async def test_risk_assessment_success(mock_api, tool_config):
     assert "WARN" in result
 
 
+@pytest.mark.asyncio
+async def test_risk_assessment_escapes_table_cells(mock_api, tool_config):
+    mock_api.get("/api/v1/portfolio/report").mock(
+        return_value=httpx.Response(200, json={
+            "xRay": {
+                "categories": [
+                    {
+                        "key": "fees",
+                        "name": "Fees",
+                        "rules": [
+                            {"name": "Fee Ratio", "isActive": True, "value": True, "evaluation": "Low | stable\nfees"},
+                        ]
+                    }
+                ]
+            }
+        })
+    )
+    result = await risk_assessment.ainvoke({}, config=tool_config)
+    assert "| Fee Ratio | PASS | Low \\| stable fees |" in result
+
+
 @pytest.mark.asyncio
 async def test_risk_assessment_empty(mock_api, tool_config):
     mock_api.get("/api/v1/portfolio/report").mock(
@@ -309,42 +370,27 @@ async def test_create_order_success(mock_api, tool_config):
 
 
 @pytest.mark.asyncio
-async def test_create_order_invalid_quantity(mock_api, tool_config):
-    result = await create_order.ainvoke({
-        "symbol": "AAPL",
-        "order_type": "BUY",
-        "quantity": -5,
-        "unit_price": 150.0,
-        "currency": "USD",
-        "date": "2024-06-01T00:00:00Z",
-    }, config=tool_config)
-    assert "quantity must be positive" in result
-
-
-@pytest.mark.asyncio
-async def test_create_order_invalid_price(mock_api, tool_config):
-    result = await create_order.ainvoke({
+@pytest.mark.parametrize(
+    ("field", "value", "expected"),
+    [
+        ("quantity", -5, "quantity must be positive"),
+        ("unit_price", -1, "unit_price must be non-negative"),
+        ("order_type", "YOLO", "invalid order type"),
+    ],
+    ids=["quantity", "price", "type"],
+)
+async def test_create_order_invalid(mock_api, tool_config, field, value, expected):
+    payload = {
         "symbol": "AAPL",
         "order_type": "BUY",
         "quantity": 10,
-        "unit_price": -1,
-        "currency": "USD",
-        "date": "2024-06-01T00:00:00Z",
-    }, config=tool_config)
-    assert "unit_price must be non-negative" in result
-
-
-@pytest.mark.asyncio
-async def test_create_order_invalid_type(mock_api, tool_config):
-    result = await create_order.ainvoke({
-        "symbol": "AAPL",
-        "order_type": "YOLO",
-        "quantity": 10,
         "unit_price": 150.0,
         "currency": "USD",
         "date": "2024-06-01T00:00:00Z",
-    }, config=tool_config)
-    assert "invalid order type" in result
+    }
+    payload[field] = value
+    result = await create_order.ainvoke(payload, config=tool_config)
+    assert expected in result
 
 
 @pytest.mark.asyncio
@@ -421,7 +467,7 @@ async def test_delete_order_empty_id(mock_api, tool_config):
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_congressional_trades_success(monkeypatch, tool_config):
+async def test_congressional_trades_success(monkeypatch, mock_api, tool_config):
     """Mock API returns trades, verify markdown table output."""
     monkeypatch.setenv("QUIVER_AUTHORIZATION_TOKEN", "test-token")
     mock_trades = [
@@ -447,11 +493,10 @@ async def test_congressional_trades_success(monkeypatch, tool_config):
         },
     ]
 
-    with respx.mock() as router:
-        router.get("https://api.quiverquant.com/beta/live/congresstrading").mock(
-            return_value=httpx.Response(200, json=mock_trades)
-        )
-        result = await congressional_trades.ainvoke({}, config=tool_config)
+    mock_api.get("https://api.quiverquant.com/beta/live/congresstrading").mock(
+        return_value=httpx.Response(200, json=mock_trades)
+    )
+    result = await congressional_trades.ainvoke({"days": 3650}, config=tool_config)
 
     assert "Congressional Stock Trades" in result
     assert "Nancy Pelosi" in result
@@ -481,28 +526,26 @@ async def test_congressional_trades_by_ticker(monkeypatch, tool_config):
 
 
 @pytest.mark.asyncio
-async def test_congressional_trades_empty(monkeypatch, tool_config):
+async def test_congressional_trades_empty(monkeypatch, mock_api, tool_config):
     """No results returns friendly message."""
     monkeypatch.setenv("QUIVER_AUTHORIZATION_TOKEN", "test-token")
 
-    with respx.mock() as router:
-        router.get("https://api.quiverquant.com/beta/live/congresstrading").mock(
-            return_value=httpx.Response(200, json=[])
-        )
-        result = await congressional_trades.ainvoke({}, config=tool_config)
+    mock_api.get("https://api.quiverquant.com/beta/live/congresstrading").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    result = await congressional_trades.ainvoke({}, config=tool_config)
 
     assert "No congressional trading data" in result
 
 
 @pytest.mark.asyncio
-async def test_congressional_trades_error(monkeypatch, tool_config):
+async def test_congressional_trades_error(monkeypatch, mock_api, tool_config):
     """API error returns friendly message."""
     monkeypatch.setenv("QUIVER_AUTHORIZATION_TOKEN", "test-token")
 
-    with respx.mock() as router:
-        router.get("https://api.quiverquant.com/beta/live/congresstrading").mock(
-            return_value=httpx.Response(500, text="Internal Server Error")
-        )
-        result = await congressional_trades.ainvoke({}, config=tool_config)
+    mock_api.get("https://api.quiverquant.com/beta/live/congresstrading").mock(
+        return_value=httpx.Response(500, text="Internal Server Error")
+    )
+    result = await congressional_trades.ainvoke({}, config=tool_config)
 
     assert "Error fetching congressional trades" in result
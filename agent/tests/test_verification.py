@@ -127,3 +127,25 @@ async def test_search_failure_allows_through(mock_api, client):
     )
     valid, reason = await verify_ticker(client, "AAPL")
     assert valid is True  # Fail-open: don't block orders due to search outage
+
+
+@pytest.mark.asyncio
+async def test_verified_symbol_is_cached(mock_api, client):
+    """A positive verification skips the API on the next lookup."""
+    route = mock_api.get("/api/v1/symbol/YAHOO/AAPL").mock(
+        return_value=httpx.Response(200, json={"symbol": "AAPL", "name": "Apple Inc."})
+    )
+    assert (await verify_ticker(client, "AAPL"))[0] is True
+    assert (await verify_ticker(client, "aapl"))[0] is True
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_verification_is_not_cached(mock_api, client):
+    """Failures are retried on the next lookup."""
+    route = mock_api.get("/api/v1/symbol/YAHOO/AAPL").mock(
+        return_value=httpx.Response(500, text="Internal Server Error")
+    )
+    assert (await verify_ticker(client, "AAPL"))[0] is False
+    assert (await verify_ticker(client, "AAPL"))[0] is False
+    assert route.call_count == 2
@@ -94,6 +94,10 @@ class TestExtractNumbers:
         nums = _extract_numbers("Loss: -3500")
         assert "-3500" in nums
 
+    def test_skips_single_digit_decimal_without_splitting(self):
+        nums = _extract_numbers("Yield: 5.25% on 1,234 shares")
+        assert nums == {"1234"}
+
 
 class TestCheckNumericConsistency:
     def test_passes_matching_numbers(self):
@@ -210,3 +214,39 @@ class TestVerifyResponse:
         )
         scope_check = next(c for c in result["checks"] if c["name"] == "scope")
         assert scope_check["passed"]
+
+    def test_repeat_calls_return_independent_results(self):
+        kwargs = dict(
+            response="Your portfolio is worth $50,000.",
+            tools_used=["portfolio_analysis"],
+            tool_outputs=["Portfolio Value: 50000 USD"],
+        )
+        first = verify_response(**kwargs)
+        first["checks"][0]["passed"] = "mutated"
+        second = verify_response(**kwargs)
+        assert second["checks"][0]["passed"] is True
+        assert second["response"] == first["response"]
+        assert second["amended"] == first["amended"]
+
+    def test_non_str_tool_output_is_verified_uncached(self):
+        result = verify_response(
+            response="Your portfolio is worth 52450 USD. This is not financial advice.",
+            tools_used=["portfolio_analysis"],
+            tool_outputs=["Portfolio Value: 52450 USD", {"value": 52450}],
+        )
+        check_names = [c["name"] for c in result["checks"]]
+        assert "numeric_consistency" in check_names
+        assert len(check_names) == 5
+
+    def test_repeat_calls_log_every_time(self, caplog):
+        kwargs = dict(
+            response="Your portfolio is worth $999,999.",
+            tools_used=["portfolio_analysis"],
+            tool_outputs=["Portfolio Value: 50000 USD"],
+        )
+        with caplog.at_level("INFO", logger="agentforge.verification"):
+            verify_response(**kwargs)
+            first = len(caplog.records)
+            verify_response(**kwargs)
+        assert first > 0
+        assert len(caplog.records) == 2 * first